@@ -56,10 +56,11 @@ async def upload_video_endpoint(file: UploadFile = File(...)):
         _state["uploading"] = True
 
     try:
-        # Save uploaded file locally
+        # Save uploaded file locally — 16MB copy buffer instead of the
+        # 64KB default cuts syscall count ~250x on multi-GB videos
         local_path = Path("uploaded_video.mp4")
         with open(local_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+            shutil.copyfileobj(file.file, f, length=16 * 1024 * 1024)
 
         # Upload to Gemini and wait for processing
         uri = upload_video(str(local_path))
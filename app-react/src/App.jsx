@@ -41,6 +41,25 @@ function App() {
     return `${m}:${sec.toString().padStart(2, '0')}`
   }
 
+  // Ad generation runs server-side in the background after the segment
+  // response, so poll /ads?event_id= until the row lands, then append it
+  const fetchPendingAd = async (event) => {
+    for (let attempt = 0; attempt < 10; attempt++) {
+      await new Promise(r => setTimeout(r, 1000))
+      try {
+        const res = await fetch(`${API_BASE}/api/ads?event_id=${event.id}`)
+        if (!res.ok) continue
+        const rows = await res.json()
+        if (rows.length > 0) {
+          setAds(prev => [...prev, { ...rows[0], is_significant: true, source_event: event }])
+          return
+        }
+      } catch (err) {
+        console.error(`Ad fetch for event ${event.id} failed:`, err)
+      }
+    }
+  }
+
   // ── Upload video: save locally in browser + send to backend → Gemini ──
   const handleFileChange = async (e) => {
     const file = e.target.files?.[0]
@@ -128,9 +147,12 @@ function App() {
           if (data.event) {
             setEvents(prev => [...prev, data.event])
           }
-          // Append ad
+          // Append ad if returned inline; otherwise it's being generated
+          // in the background — poll for it
           if (data.ad) {
-            setAds(prev => [...prev, { ...data.ad, source_event: data.event }])
+            setAds(prev => [...prev, { ...data.ad, is_significant: true, source_event: data.event }])
+          } else if (data.event?.generate_ad) {
+            fetchPendingAd(data.event)
           }
         } catch (err) {
           console.error(`Segment ${seg.key} failed:`, err)
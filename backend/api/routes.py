@@ -14,19 +14,19 @@ This layer does NOT:
 
 All of that is delegated to the appropriate modules.
 """
-import json
-import shutil
+import asyncio
 import threading
-from datetime import datetime
-from pathlib import Path
+import time
+from functools import lru_cache
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
+from sqlalchemy import case, func, insert, select, text
 
-from ..db.database import get_db, reset_db
-from ..db.models import Event, Ad, PipelineMetrics
+from ..db.database import get_db, get_db_context, reset_db
+from ..db.models import Event, Ad, PipelineMetrics, utcnow
 from ..api.schemas import (
     AnalyzeSegmentRequest, GenerateAdRequest,
     EventResponse, AdResponse, AnalysisResult,
@@ -36,6 +36,7 @@ from ..core.scoring import calculate_event_score
 from ..core.decision import make_decision
 from ..services.gemini import GeminiService
 from ..services.groq import GroqService
+from ..services import llm_cache
 
 
 router = APIRouter(prefix="/api", tags=["api"])
@@ -47,13 +48,43 @@ _state = {
 }
 _state_lock = threading.Lock()
 
+# ── Short-TTL cache for /metrics (dashboard polls every second) ──
+METRICS_CACHE_TTL_SEC = 1.5
+_metrics_cache = {"at": 0.0, "value": None}
+_metrics_cache_lock = threading.Lock()
+
+
+def _invalidate_metrics_cache():
+    """Force the next /metrics call to recompute (new data was written)."""
+    with _metrics_cache_lock:
+        _metrics_cache["at"] = 0.0
+        _metrics_cache["value"] = None
+
+
+# ── Cached LLM service singletons ──
+# Constructing the SDK clients per request re-did auth setup and dropped
+# their keep-alive connection pools every call. Lazy factories keep the
+# app importable without API keys (the error surfaces on first use).
+
+@lru_cache(maxsize=1)
+def get_gemini_service() -> GeminiService:
+    return GeminiService()
+
+
+@lru_cache(maxsize=1)
+def get_groq_service() -> GroqService:
+    return GroqService()
+
 
 # ─────────────────────────────────────────────
 # Video Upload
 # ─────────────────────────────────────────────
 
 @router.post("/upload-video")
-async def upload_video(file: UploadFile = File(...)):
+async def upload_video(
+    file: UploadFile = File(...),
+    gemini: GeminiService = Depends(get_gemini_service),
+):
     """
     Upload video to Gemini File API.
     Returns Gemini file URI for segment analysis.
@@ -64,15 +95,13 @@ async def upload_video(file: UploadFile = File(...)):
         _state["uploading"] = True
     
     try:
-        # Save locally
-        local_path = Path("uploaded_video.mp4")
-        with open(local_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
-        
-        # Upload to Gemini
-        gemini = GeminiService()
-        uri = gemini.upload_video(str(local_path))
-        
+        # Stream straight to Gemini — no local mp4 copy, so we skip a full
+        # disk write + re-read of the (potentially multi-GB) upload
+        uri = await gemini.upload_video_stream_async(
+            file.file,
+            mime_type=file.content_type or "video/mp4",
+        )
+
         with _state_lock:
             _state["video_uri"] = uri
         
@@ -100,10 +129,61 @@ def upload_status():
 # Segment Analysis — THE MAIN PIPELINE
 # ─────────────────────────────────────────────
 
+async def _generate_and_store_ad(
+    event_id: int,
+    event_type: str,
+    summary: str,
+    urgency: str,
+    business_name: str,
+    business_type: str,
+):
+    """
+    Background task: generate an ad for an event and persist it.
+
+    Runs after the analyze-segment response has been sent, so the Groq
+    round-trip no longer sits on the client's critical path. Clients
+    fetch the result via /ads (filterable by event_id).
+    """
+    ad_key = llm_cache.groq_cache_key(
+        event_type, urgency, summary, business_name, business_type
+    )
+    with get_db_context() as cache_db:
+        ad_result = llm_cache.get_cached_ad(cache_db, ad_key)
+
+    if ad_result is None:
+        groq = get_groq_service()
+        ad_result = await groq.generate_ad_async(
+            event_type=event_type,
+            urgency=urgency,
+            summary=summary,
+            business_name=business_name,
+            business_type=business_type,
+        )
+        if ad_result.success:
+            with get_db_context() as cache_db:
+                llm_cache.store_ad(cache_db, ad_key, ad_result)
+
+    if ad_result.success:
+        with get_db_context() as db:
+            db.add(Ad(
+                event_id=event_id,
+                ad_copy=ad_result.ad_copy,
+                promo_suggestion=ad_result.promo_suggestion,
+                social_hashtags=ad_result.social_hashtags,
+                urgency=urgency,
+                business_name=business_name,
+                business_type=business_type,
+                groq_latency_ms=ad_result.latency_ms,
+            ))
+        _invalidate_metrics_cache()
+
+
 @router.post("/analyze-segment", response_model=AnalysisResult)
-def analyze_segment(
+async def analyze_segment(
     request: AnalyzeSegmentRequest,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    gemini: GeminiService = Depends(get_gemini_service),
 ):
     """
     Analyze ONE video segment — the full pipeline:
@@ -112,9 +192,12 @@ def analyze_segment(
     2. Validate/normalize event
     3. Score event (scoring engine)
     4. Make decision (decision layer)
-    5. IF decision.generate_ad → Groq generates ad
+    5. IF decision.generate_ad → Groq generates ad (in the background)
     6. Save to database
     7. Return result with explanation
+
+    The Event + decision return immediately; the ad, when one is due,
+    lands in the database afterwards and is fetched via /ads.
     """
     # Determine video URI
     uri = request.video_uri
@@ -124,9 +207,22 @@ def analyze_segment(
     if not uri:
         raise HTTPException(status_code=400, detail="No video uploaded. Upload first.")
     
-    # ── Step 1: Gemini Analysis ──
-    gemini = GeminiService()
-    analysis = gemini.analyze_segment(uri, request.start_sec, request.end_sec)
+    # ── Step 1: Gemini Analysis (exact-match cache first) ──
+    # The cache read gets its own short-lived session: reading on the
+    # request session would start a transaction and hold its pooled
+    # connection across the multi-second Gemini await on a miss
+    with get_db_context() as cache_db:
+        analysis = llm_cache.get_cached_analysis(
+            cache_db, uri, request.start_sec, request.end_sec
+        )
+    if analysis is None:
+        analysis = await gemini.analyze_segment_async(
+            uri, request.start_sec, request.end_sec
+        )
+        if analysis.success:
+            llm_cache.store_analysis(
+                db, uri, request.start_sec, request.end_sec, analysis
+            )
     
     # If analysis failed, create event marked as discarded
     if not analysis.success:
@@ -146,7 +242,8 @@ def analyze_segment(
         db.add(event)
         db.commit()
         db.refresh(event)
-        
+        _invalidate_metrics_cache()
+
         return AnalysisResult(
             event=EventResponse.model_validate(event),
             ad=None,
@@ -182,46 +279,225 @@ def analyze_segment(
     db.add(event)
     db.commit()
     db.refresh(event)
-    
-    # ── Step 5: Generate Ad (if decision says so) ──
-    ad_response = None
+    event_response = EventResponse.model_validate(event)
+    event_id = event.id
+
+    # Release the session before returning; the background ad task uses
+    # its own short-lived sessions.
+    db.close()
+
+    # ── Step 5: Schedule Ad Generation (if decision says so) ──
+    # The Groq round-trip runs after the response is sent, cutting its
+    # full latency out of the endpoint's critical path.
     if decision.generate_ad:
-        groq = GroqService()
-        ad_result = groq.generate_ad(
-            event_type=analysis.event_type,
-            urgency=decision.urgency,
-            summary=analysis.summary,
-            business_name=request.business_name,
-            business_type=request.business_type,
+        background_tasks.add_task(
+            _generate_and_store_ad,
+            event_id,
+            analysis.event_type,
+            analysis.summary,
+            decision.urgency,
+            request.business_name,
+            request.business_type,
         )
-        
-        if ad_result.success:
-            ad = Ad(
-                event_id=event.id,
-                ad_copy=ad_result.ad_copy,
-                promo_suggestion=ad_result.promo_suggestion,
-                social_hashtags=json.dumps(ad_result.social_hashtags),
-                urgency=decision.urgency,
-                business_name=request.business_name,
-                business_type=request.business_type,
-                groq_latency_ms=ad_result.latency_ms,
-            )
-            db.add(ad)
-            db.commit()
-            db.refresh(ad)
-            ad_response = AdResponse.model_validate(ad)
-    
+
     # ── Step 6: Build Decision Explanation ──
     reason_parts = [decision.reason]
+    if decision.generate_ad:
+        reason_parts.append("Ad generation pending (fetch via /ads)")
     reason_parts.append("Score breakdown: " + "; ".join(score_reasons))
-    
+
+    _invalidate_metrics_cache()
+
     return AnalysisResult(
-        event=EventResponse.model_validate(event),
-        ad=ad_response,
+        event=event_response,
+        ad=None,
         decision_reason=" | ".join(reason_parts)
     )
 
 
+@router.post("/analyze-batch", response_model=list[AnalysisResult])
+async def analyze_batch(
+    requests: list[AnalyzeSegmentRequest],
+    db: Session = Depends(get_db),
+    gemini: GeminiService = Depends(get_gemini_service),
+    groq: GroqService = Depends(get_groq_service),
+):
+    """
+    Analyze MANY video segments in one call.
+
+    Same pipeline as /analyze-segment, but:
+    - Gemini calls run concurrently on the event loop (asyncio.gather)
+    - All Events are written with ONE bulk insert, all Ads with another
+    - One commit total instead of one per segment
+    """
+    if not requests:
+        return []
+
+    # Determine video URI per segment (shared fallback to uploaded video)
+    with _state_lock:
+        default_uri = _state["video_uri"]
+    uris = [r.video_uri or default_uri for r in requests]
+    if any(uri is None for uri in uris):
+        raise HTTPException(status_code=400, detail="No video uploaded. Upload first.")
+
+    # ── Step 1: Concurrent Gemini Analysis (exact-match cache first) ──
+    # Cached segments are resolved up front in a short-lived session
+    # (never the request session — no transaction may be open across the
+    # awaits below); only the misses go to Gemini
+    analyses = [None] * len(requests)
+    with get_db_context() as cache_db:
+        for i, (req, uri) in enumerate(zip(requests, uris)):
+            analyses[i] = llm_cache.get_cached_analysis(
+                cache_db, uri, req.start_sec, req.end_sec
+            )
+    misses = [i for i, analysis in enumerate(analyses) if analysis is None]
+
+    # Misses are grouped per URI (normally a single group) and each
+    # group fans out through GeminiService.analyze_segments
+    groups: dict[str, list[int]] = {}
+    for i in misses:
+        groups.setdefault(uris[i], []).append(i)
+
+    group_results = await asyncio.gather(*(
+        gemini.analyze_segments(
+            uri, [(requests[i].start_sec, requests[i].end_sec) for i in indices]
+        )
+        for uri, indices in groups.items()
+    ))
+
+    for indices, results in zip(groups.values(), group_results):
+        for i, analysis in zip(indices, results):
+            analyses[i] = analysis
+
+    # ── Step 2+3: Score and Decide per segment, build Event rows ──
+    now = utcnow()
+    event_rows = []
+    decisions = []
+    reasons = []
+    for req, analysis in zip(requests, analyses):
+        if not analysis.success:
+            event_rows.append({
+                "start_sec": req.start_sec,
+                "end_sec": req.end_sec,
+                "event_type": "unknown",
+                "intensity": "low",
+                "summary": analysis.error or "Analysis failed",
+                "crowd_reaction": None,
+                "confidence": analysis.confidence,
+                "score": 0.0,
+                "generate_ad": False,
+                "urgency": "ignore",
+                "raw_response": analysis.raw_response,
+                "gemini_latency_ms": analysis.latency_ms,
+                "created_at": now,
+            })
+            decisions.append(None)
+            reasons.append(f"Segment discarded: {analysis.error}")
+            continue
+
+        score, score_reasons = calculate_event_score(
+            event_type=analysis.event_type,
+            intensity=analysis.intensity,
+            confidence=analysis.confidence,
+            crowd_reaction=analysis.crowd_reaction,
+        )
+        decision = make_decision(score, analysis.event_type)
+        event_rows.append({
+            "start_sec": req.start_sec,
+            "end_sec": req.end_sec,
+            "event_type": analysis.event_type,
+            "intensity": analysis.intensity,
+            "summary": analysis.summary,
+            "crowd_reaction": analysis.crowd_reaction,
+            "confidence": analysis.confidence,
+            "score": score,
+            "generate_ad": decision.generate_ad,
+            "urgency": decision.urgency,
+            "raw_response": analysis.raw_response,
+            "gemini_latency_ms": analysis.latency_ms,
+            "created_at": now,
+        })
+        decisions.append(decision)
+        reasons.append(
+            decision.reason + " | Score breakdown: " + "; ".join(score_reasons)
+        )
+
+    # ── Step 4: Generate Ads for segments the decision layer approved ──
+    # Concurrent on the event loop, same as the Gemini fan-out — and
+    # before any insert, so no transaction is held across the awaits
+    approved = [
+        i for i, decision in enumerate(decisions)
+        if decision is not None and decision.generate_ad
+    ]
+    ad_results = await asyncio.gather(*(
+        groq.generate_ad_async(
+            event_type=analyses[i].event_type,
+            urgency=decisions[i].urgency,
+            summary=analyses[i].summary,
+            business_name=requests[i].business_name,
+            business_type=requests[i].business_type,
+        )
+        for i in approved
+    ))
+
+    # Fresh successful analyses join the exact-match cache inside the
+    # same transaction as the bulk inserts (all awaits are done now)
+    for i in misses:
+        if analyses[i].success:
+            llm_cache.store_analysis(
+                db, uris[i], requests[i].start_sec, requests[i].end_sec, analyses[i]
+            )
+
+    # ── Step 5: Bulk-insert all Events (one executemany) ──
+    result = db.execute(
+        insert(Event).returning(Event.id, sort_by_parameter_order=True),
+        event_rows,
+    )
+    event_ids = [row.id for row in result]
+
+    ad_rows = []
+    ad_row_index = {}  # segment index → position in ad_rows
+    for i, ad_result in zip(approved, ad_results):
+        if ad_result.success:
+            ad_row_index[i] = len(ad_rows)
+            ad_rows.append({
+                "event_id": event_ids[i],
+                "ad_copy": ad_result.ad_copy,
+                "promo_suggestion": ad_result.promo_suggestion,
+                "social_hashtags": ad_result.social_hashtags,
+                "urgency": decisions[i].urgency,
+                "business_name": requests[i].business_name,
+                "business_type": requests[i].business_type,
+                "groq_latency_ms": ad_result.latency_ms,
+                "created_at": now,
+            })
+
+    # ── Step 6: Bulk-insert all Ads, single commit for everything ──
+    ad_ids = []
+    if ad_rows:
+        result = db.execute(
+            insert(Ad).returning(Ad.id, sort_by_parameter_order=True),
+            ad_rows,
+        )
+        ad_ids = [row.id for row in result]
+    db.commit()
+    _invalidate_metrics_cache()
+
+    # ── Step 7: Build responses from the rows we just wrote ──
+    results = []
+    for i, event_row in enumerate(event_rows):
+        ad_response = None
+        if i in ad_row_index:
+            pos = ad_row_index[i]
+            ad_response = AdResponse.model_validate({**ad_rows[pos], "id": ad_ids[pos]})
+        results.append(AnalysisResult(
+            event=EventResponse.model_validate({**event_row, "id": event_ids[i]}),
+            ad=ad_response,
+            decision_reason=reasons[i],
+        ))
+    return results
+
+
 # ─────────────────────────────────────────────
 # Read Endpoints
 # ─────────────────────────────────────────────
@@ -229,31 +505,46 @@ def analyze_segment(
 @router.get("/events", response_model=list[EventResponse])
 def get_events(db: Session = Depends(get_db)):
     """Get all detected events from database."""
-    events = db.query(Event).order_by(Event.start_sec).all()
-    return [EventResponse.model_validate(e) for e in events]
+    # Return ORM rows as-is; response_model converts once on serialization
+    # instead of us re-validating every row in Python first
+    return db.execute(select(Event).order_by(Event.start_sec)).scalars().all()
 
 
 @router.get("/ads", response_model=list[AdResponse])
-def get_ads(db: Session = Depends(get_db)):
-    """Get all generated ads from database."""
-    ads = db.query(Ad).order_by(Ad.created_at).all()
-    return [AdResponse.model_validate(a) for a in ads]
+def get_ads(event_id: Optional[int] = None, db: Session = Depends(get_db)):
+    """Get generated ads, optionally only those for one event."""
+    query = select(Ad)
+    if event_id is not None:
+        query = query.where(Ad.event_id == event_id)
+    return db.execute(query.order_by(Ad.created_at)).scalars().all()
 
 
 @router.get("/metrics", response_model=MetricsResponse)
 def get_metrics(db: Session = Depends(get_db)):
     """Get pipeline metrics for evaluation."""
-    # Calculate metrics from events and ads
-    total_segments = db.query(Event).count()
-    segments_discarded = db.query(Event).filter(Event.generate_ad == False).count()
-    ads_generated = db.query(Ad).count()
-    
-    avg_gemini = db.query(func.avg(Event.gemini_latency_ms)).scalar() or 0
-    avg_groq = db.query(func.avg(Ad.groq_latency_ms)).scalar() or 0
-    
+    # Serve from cache while fresh — polling dashboards hit this endpoint
+    # far more often than the underlying tables change
+    with _metrics_cache_lock:
+        if time.monotonic() - _metrics_cache["at"] < METRICS_CACHE_TTL_SEC:
+            return _metrics_cache["value"]
+
+    # One aggregate pass per table instead of five separate scans
+    total_segments, segments_discarded, avg_gemini = db.query(
+        func.count(Event.id),
+        func.sum(case((Event.generate_ad == False, 1), else_=0)),
+        func.avg(Event.gemini_latency_ms),
+    ).one()
+    ads_generated, avg_groq = db.query(
+        func.count(Ad.id),
+        func.avg(Ad.groq_latency_ms),
+    ).one()
+
+    segments_discarded = segments_discarded or 0
+    avg_gemini = avg_gemini or 0
+    avg_groq = avg_groq or 0
     discard_rate = segments_discarded / total_segments if total_segments > 0 else 0
     
-    return MetricsResponse(
+    metrics = MetricsResponse(
         avg_gemini_latency_ms=round(avg_gemini, 2),
         avg_groq_latency_ms=round(avg_groq, 2),
         total_segments=total_segments,
@@ -262,6 +553,12 @@ def get_metrics(db: Session = Depends(get_db)):
         discard_rate=round(discard_rate, 4),
     )
 
+    with _metrics_cache_lock:
+        _metrics_cache["at"] = time.monotonic()
+        _metrics_cache["value"] = metrics
+
+    return metrics
+
 
 # ─────────────────────────────────────────────
 # Reset & Health
@@ -271,9 +568,10 @@ def get_metrics(db: Session = Depends(get_db)):
 def reset_all(db: Session = Depends(get_db)):
     """Clear all data and reset database."""
     reset_db()
+    _invalidate_metrics_cache()
     with _state_lock:
         _state["video_uri"] = None
-    return {"status": "cleared", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "cleared", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -289,7 +587,7 @@ def health(db: Session = Depends(get_db)):
     return HealthResponse(
         status="ok",
         database=db_status,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
 
 
@@ -298,12 +596,17 @@ def health(db: Session = Depends(get_db)):
 # ─────────────────────────────────────────────
 
 @router.post("/live-segment")
-def live_segment(request: AnalyzeSegmentRequest, db: Session = Depends(get_db)):
+async def live_segment(
+    request: AnalyzeSegmentRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    gemini: GeminiService = Depends(get_gemini_service),
+):
     """Legacy endpoint - redirects to analyze-segment."""
-    return analyze_segment(request, db)
+    return await analyze_segment(request, background_tasks, db, gemini)
 
 
-@router.get("/ad-results")
+@router.get("/ad-results", response_model=list[AdResponse])
 def get_ad_results(db: Session = Depends(get_db)):
     """Legacy endpoint - redirects to /ads."""
-    return get_ads(db)
+    return get_ads(db=db)
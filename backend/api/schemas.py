@@ -49,7 +49,7 @@ class GeminiEventResponse(BaseModel):
     summary: str = Field("", description="Short event description")
     crowd_reaction: str = Field("", description="Crowd response description")
     confidence: float = Field(0.0, ge=0.0, le=1.0, description="Confidence score 0-1")
-    
+
     @field_validator('intensity')
     @classmethod
     def validate_intensity(cls, v):
@@ -93,7 +93,7 @@ class AdResponse(BaseModel):
     event_id: int
     ad_copy: str
     promo_suggestion: Optional[str]
-    social_hashtags: Optional[str]
+    social_hashtags: Optional[List[str]]
     urgency: str
     business_name: Optional[str]
     business_type: Optional[str]
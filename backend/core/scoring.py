@@ -5,6 +5,7 @@ Pure Python. No LLM. Deterministic. Unit-testable.
 
 This replaces vibes with logic. Every score can be explained.
 """
+import re
 
 # ─────────────────────────────────────────────
 # Scoring Rules (Baseline Configuration)
@@ -51,11 +52,60 @@ CROWD_KEYWORDS = {
     "gasp": 1,
 }
 
+# Single-pass scan for crowd keywords: one compiled DFA instead of one
+# substring search per keyword. Named groups map the match back to its key.
+CROWD_PATTERN = re.compile(
+    "|".join(f"(?P<{keyword}>{re.escape(keyword)})" for keyword in CROWD_KEYWORDS)
+)
+
 # Confidence penalty threshold
 CONFIDENCE_PENALTY_THRESHOLD = 0.5
 CONFIDENCE_PENALTY = -3
 
 
+def _compute_score(
+    event_type: str,
+    intensity: str,
+    low_confidence: bool,
+    crowd_key: "str | None",
+) -> float:
+    """Combine the rule components into a clamped 0-10 score."""
+    score = EVENT_TYPE_SCORES.get(event_type, -2)
+    score += INTENSITY_SCORES.get(intensity, 0)
+    if low_confidence:
+        score += CONFIDENCE_PENALTY
+    if crowd_key is not None:
+        score += CROWD_KEYWORDS[crowd_key]
+    return max(0.0, min(10.0, float(score)))
+
+
+# All inputs are categorical, so every possible score is known up front:
+# 12 event types × 3 intensities × 2 confidence buckets × (8 crowd keys
+# or none). Precompute them once so the hot path is a single dict lookup.
+SCORE_TABLE: dict[tuple, float] = {
+    (event_type, intensity, low_confidence, crowd_key): _compute_score(
+        event_type, intensity, low_confidence, crowd_key
+    )
+    for event_type in EVENT_TYPE_SCORES
+    for intensity in INTENSITY_SCORES
+    for low_confidence in (False, True)
+    for crowd_key in (None, *CROWD_KEYWORDS)
+}
+
+
+def _find_crowd_keyword(crowd_reaction: str) -> "str | None":
+    """Highest-priority crowd keyword in the reaction text, if any."""
+    if not crowd_reaction:
+        return None
+    # One scan collects every keyword present; the winner is the first
+    # in CROWD_KEYWORDS order ("loud" beats "boo" in "booing loudly"),
+    # not the leftmost occurrence in the text
+    found = {m.lastgroup for m in CROWD_PATTERN.finditer(crowd_reaction.lower())}
+    if not found:
+        return None
+    return next(keyword for keyword in CROWD_KEYWORDS if keyword in found)
+
+
 def calculate_event_score(
     event_type: str,
     intensity: str,
@@ -64,53 +114,53 @@ def calculate_event_score(
 ) -> tuple[float, list[str]]:
     """
     Calculate event score from 0-10 with explanation.
-    
+
+    Inputs arrive pre-normalized (lowercase) from the Gemini service /
+    schema validators, so no case-folding happens here.
+
     Args:
         event_type: Normalized event type (lowercase)
         intensity: "low", "medium", or "high"
         confidence: Gemini confidence score (0-1)
         crowd_reaction: Optional crowd description
-        
+
     Returns:
         (score, reasons): Score clamped to 0-10 and list of scoring reasons
     """
+    low_confidence = confidence < CONFIDENCE_PENALTY_THRESHOLD
+    crowd_key = _find_crowd_keyword(crowd_reaction)
+
+    key = (event_type, intensity, low_confidence, crowd_key)
+    score = SCORE_TABLE.get(key)
+    if score is None:
+        score = _compute_score(*key)
+
+    # Reasons are for the explanation only — rebuilt from the same
+    # components the table was computed from
     reasons = []
-    score = 0.0
-    
-    # 1. Base score from event type
-    event_type_lower = event_type.lower()
-    base_score = EVENT_TYPE_SCORES.get(event_type_lower, -2)
-    score += base_score
-    reasons.append(f"Event type '{event_type_lower}': {base_score:+d}")
-    
-    # 2. Intensity modifier
-    intensity_lower = intensity.lower()
-    intensity_score = INTENSITY_SCORES.get(intensity_lower, 0)
-    score += intensity_score
+    raw_score = 0.0
+
+    base_score = EVENT_TYPE_SCORES.get(event_type, -2)
+    raw_score += base_score
+    reasons.append(f"Event type '{event_type}': {base_score:+d}")
+
+    intensity_score = INTENSITY_SCORES.get(intensity, 0)
+    raw_score += intensity_score
     if intensity_score != 0:
-        reasons.append(f"Intensity '{intensity_lower}': {intensity_score:+d}")
-    
-    # 3. Confidence penalty
-    if confidence < CONFIDENCE_PENALTY_THRESHOLD:
-        score += CONFIDENCE_PENALTY
+        reasons.append(f"Intensity '{intensity}': {intensity_score:+d}")
+
+    if low_confidence:
+        raw_score += CONFIDENCE_PENALTY
         reasons.append(f"Low confidence ({confidence:.2f}): {CONFIDENCE_PENALTY:+d}")
-    
-    # 4. Crowd reaction bonus
-    if crowd_reaction:
-        crowd_lower = crowd_reaction.lower()
-        for keyword, bonus in CROWD_KEYWORDS.items():
-            if keyword in crowd_lower:
-                score += bonus
-                reasons.append(f"Crowd '{keyword}': {bonus:+d}")
-                break  # Only apply one crowd bonus
-    
-    # 5. Clamp to 0-10
-    raw_score = score
-    score = max(0.0, min(10.0, score))
-    
+
+    if crowd_key is not None:
+        bonus = CROWD_KEYWORDS[crowd_key]
+        raw_score += bonus
+        reasons.append(f"Crowd '{crowd_key}': {bonus:+d}")
+
     if raw_score != score:
         reasons.append(f"Clamped from {raw_score:.1f} to {score:.1f}")
-    
+
     return score, reasons
 
 
@@ -5,10 +5,11 @@ Database Configuration — SQLite with SQLAlchemy.
 - Auto-initialization on import
 - Session management for FastAPI dependency injection
 """
+import os
 from pathlib import Path
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 from .models import Base
@@ -17,13 +18,46 @@ from .models import Base
 DB_PATH = Path(__file__).resolve().parent.parent.parent / "superbowl_pulse.db"
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-# Create engine with SQLite-specific settings
+# Connection pool tuning (overridable via environment for deployment)
+POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+POOL_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+
+# Create engine with SQLite-specific settings.
+# An explicit QueuePool keeps connections warm across requests: get_db
+# sessions can be held open through multi-second Gemini/Groq calls, so
+# without headroom the pool exhausts under concurrent /analyze-segment.
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Required for SQLite + FastAPI
     echo=False,  # Set to True for SQL debugging
+    pool_size=POOL_SIZE,
+    max_overflow=POOL_MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=POOL_RECYCLE,
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune SQLite for the write-heavy analyze-segment path.
+
+    - WAL journal: commits append to a log instead of rewriting the
+      journal, and readers (/events, /metrics) don't block the writer.
+    - synchronous=NORMAL: safe with WAL, skips one fsync per commit.
+    - Memory temp store + mmap + larger page cache for read endpoints.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA cache_size=-64000")    # 64MB
+    cursor.close()
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -34,6 +68,11 @@ def init_db():
     Called automatically on first import, idempotent.
     """
     Base.metadata.create_all(bind=engine)
+    # create_all only creates missing tables; also create any indexes
+    # added to already-existing tables (one-shot migration for dev DBs)
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def get_db():
@@ -79,7 +118,3 @@ def reset_db():
     """
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
-
-
-# Auto-initialize on import
-init_db()
@@ -5,19 +5,28 @@ Tables:
 - events: Detected match events with scoring and confidence
 - ads: Generated advertisements linked to events
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum as PyEnum
 from typing import Optional
 
 from sqlalchemy import (
-    Column, Integer, Float, String, Text, DateTime, 
-    ForeignKey, Enum, Boolean
+    Column, Integer, Float, String, Text, DateTime,
+    ForeignKey, Enum, Boolean, func, Index, JSON
 )
 from sqlalchemy.orm import relationship, declarative_base
 
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """
+    Current UTC time, naive — matches how the DateTime columns (and
+    SQLite's CURRENT_TIMESTAMP) store values. datetime.utcnow() is
+    deprecated; this is the supported spelling.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class EventType(str, PyEnum):
     """Normalized event types - strict enumeration."""
     GOAL = "goal"
@@ -60,11 +69,11 @@ class Event(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Time window
-    start_sec = Column(Integer, nullable=False)
+    start_sec = Column(Integer, nullable=False, index=True)  # /events sorts on this
     end_sec = Column(Integer, nullable=False)
     
     # Event classification (from Gemini, normalized)
-    event_type = Column(String(50), nullable=False, default="unknown")
+    event_type = Column(String(50), nullable=False, default="unknown", index=True)
     intensity = Column(String(20), nullable=False, default="low")
     
     # Gemini output
@@ -76,7 +85,7 @@ class Event(Base):
     score = Column(Float, nullable=False, default=0.0)
     
     # Decision layer output
-    generate_ad = Column(Boolean, nullable=False, default=False)
+    generate_ad = Column(Boolean, nullable=False, default=False, index=True)  # /metrics discard filter
     urgency = Column(String(20), nullable=True)
     
     # Raw Gemini response (for debugging)
@@ -85,8 +94,8 @@ class Event(Base):
     # Latency tracking
     gemini_latency_ms = Column(Integer, nullable=True)
     
-    # Audit
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Audit (filled by SQLite, not Python — cheaper bulk inserts)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationship
     ads = relationship("Ad", back_populates="event", cascade="all, delete-orphan")
@@ -106,12 +115,12 @@ class Ad(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Link to source event
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False, index=True)
     
     # Generated content
     ad_copy = Column(Text, nullable=False)
     promo_suggestion = Column(Text, nullable=True)
-    social_hashtags = Column(Text, nullable=True)  # JSON array stored as text
+    social_hashtags = Column(JSON, nullable=True)  # list of hashtag strings
     
     # Decision context
     urgency = Column(String(20), nullable=False, default="soft")
@@ -123,8 +132,8 @@ class Ad(Base):
     # Latency tracking
     groq_latency_ms = Column(Integer, nullable=True)
     
-    # Audit
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Audit (filled by SQLite, not Python — cheaper bulk inserts)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)  # /ads sorts on this
     
     # Relationship
     event = relationship("Event", back_populates="ads")
@@ -133,6 +142,61 @@ class Ad(Base):
         return f"<Ad id={self.id} event_id={self.event_id} urgency={self.urgency}>"
 
 
+class LLMCache(Base):
+    """
+    Exact-match cache for Gemini segment analyses.
+
+    Re-analyzing the same (video_uri, start_sec, end_sec) — dashboard
+    replays, retries, reloads — costs seconds and money. One row per
+    analyzed segment, storing the parsed result as JSON.
+    """
+    __tablename__ = "llm_cache"
+    __table_args__ = (
+        # One row per analyzed segment — store_analysis upserts on this key
+        Index("uq_llm_cache_segment", "video_uri", "start_sec", "end_sec", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Cache key (unique together, see __table_args__)
+    video_uri = Column(String(500), nullable=False)
+    start_sec = Column(Integer, nullable=False)
+    end_sec = Column(Integer, nullable=False)
+
+    # Serialized GeminiAnalysisResult
+    response_json = Column(Text, nullable=False)
+
+    # For TTL eviction
+    created_at = Column(DateTime, default=utcnow)
+
+    def __repr__(self):
+        return f"<LLMCache id={self.id} uri={self.video_uri} [{self.start_sec},{self.end_sec}]>"
+
+
+class GroqCache(Base):
+    """
+    Exact-match cache for Groq ad generations.
+
+    Keyed by a BLAKE2 hash of the prompt inputs (event_type, urgency,
+    summary, business context).
+    """
+    __tablename__ = "groq_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # BLAKE2 hash of prompt inputs
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)
+
+    # Serialized AdGenerationResult
+    response_json = Column(Text, nullable=False)
+
+    # For TTL eviction
+    created_at = Column(DateTime, default=utcnow)
+
+    def __repr__(self):
+        return f"<GroqCache id={self.id} key={self.cache_key[:8]}>"
+
+
 class PipelineMetrics(Base):
     """
     Aggregated pipeline metrics for evaluation.
@@ -155,7 +219,7 @@ class PipelineMetrics(Base):
     ads_generated = Column(Integer, default=0)
     
     # Timestamps
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, server_default=func.now(), nullable=False)
     completed_at = Column(DateTime, nullable=True)
     
     def __repr__(self):
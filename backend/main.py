@@ -4,20 +4,48 @@ SuperBowl Ad Pulse — Main FastAPI Application.
 Entry point for the backend API.
 This file does minimal setup and imports routes from the api module.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+import anyio
 
-from .api.routes import router
+from .api.routes import router, get_gemini_service, get_groq_service
 from .db.database import init_db
 
-# Initialize database on startup
-init_db()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    One-time startup work, per worker, off the import path:
+
+    - init_db() runs here (in a thread — it's blocking I/O) instead of
+      at module import, so reload reimports and multi-worker spawns
+      don't redundantly re-run schema setup
+    - the LLM service singletons are constructed and pinned to
+      app.state, so the first request doesn't pay client construction;
+      missing API keys must not kill startup (dev environments) — the
+      error still surfaces on first use
+    """
+    await anyio.to_thread.run_sync(init_db)
+    try:
+        app.state.gemini = get_gemini_service()
+        app.state.groq = get_groq_service()
+    except ValueError:
+        app.state.gemini = None
+        app.state.groq = None
+    yield
+
 
 # Create FastAPI app
 app = FastAPI(
     title="SuperBowl Ad Pulse API",
     description="Real-time sports video analysis and ad generation pipeline",
     version="2.0.0",
+    default_response_class=ORJSONResponse,  # C JSON encoder for the list-heavy endpoints
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -34,7 +62,7 @@ app.include_router(router)
 
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint with API info."""
     return {
         "name": "SuperBowl Ad Pulse API",
@@ -45,5 +73,25 @@ def root():
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True)
+
+    if os.environ.get("WEB_RELOAD") == "1":
+        # Dev mode: auto-reload needs a single worker
+        uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # uvloop + httptools (from uvicorn[standard]) replace the stock
+        # event loop and HTTP parser with C ones. Single worker by
+        # default: the upload state in routes.py (_state) is per-process,
+        # so extra workers wouldn't see each other's uploaded video URI.
+        # WEB_WORKERS opts in when every request carries its own
+        # video_uri (2n+1 suits this I/O-bound workload).
+        uvicorn.run(
+            "backend.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.environ.get("WEB_WORKERS", "1")),
+            loop="uvloop",
+            http="httptools",
+        )
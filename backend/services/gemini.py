@@ -5,13 +5,17 @@ Gemini observes. It never decides.
 All output is validated JSON.
 Invalid responses are discarded.
 """
-import json
+import asyncio
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional, Union
 from dataclasses import dataclass
 
+import httpx
+import msgspec
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
@@ -20,7 +24,40 @@ from google.genai import types
 load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
 
 
-@dataclass
+class _GeminiJSON(msgspec.Struct):
+    """Typed shape of Gemini's strict-JSON reply."""
+    event_type: str = "unknown"
+    intensity: str = "low"
+    summary: str = ""
+    crowd_reaction: str = ""
+    confidence: float = 0.0
+
+
+# Typed single-pass decode straight into the struct — no intermediate
+# dict and no per-field .get() calls in the parse path
+_GEMINI_DECODER = msgspec.json.Decoder(_GeminiJSON)
+
+def _extract_fenced_json(raw_text: str) -> str:
+    """
+    Strip a markdown code fence (``` or ```json) around the JSON payload.
+
+    Plain find() index arithmetic with a single slice — no regex engine
+    and no intermediate split() lists, which matters when Gemini echoes
+    long responses. The JSON decoder tolerates the surrounding whitespace.
+    """
+    i = raw_text.find("```")
+    if i < 0:
+        return raw_text
+    i += 3
+    if raw_text.startswith("json", i):
+        i += 4
+    j = raw_text.find("```", i)
+    return raw_text[i:j] if j >= 0 else raw_text[i:]
+
+
+# slots drops the per-instance __dict__ (these are churned per segment);
+# frozen makes results safely shareable, e.g. from caches
+@dataclass(slots=True, frozen=True)
 class GeminiAnalysisResult:
     """Result from Gemini video analysis."""
     success: bool
@@ -51,6 +88,23 @@ class GeminiService:
     
     MODEL = "models/gemini-2.5-flash"
     CONFIDENCE_THRESHOLD = 0.4  # Discard below this
+
+    # Built once at class definition — the normalizers run per response
+    KNOWN_EVENT_TYPES = frozenset({
+        "goal", "touchdown", "tackle", "interception", "fumble",
+        "penalty", "big_play", "injury", "halftime", "timeout",
+        "celebration", "unknown"
+    })
+    VALID_INTENSITIES = frozenset({"low", "medium", "high"})
+    # Common off-vocabulary spellings Gemini occasionally emits, mapped
+    # onto the known vocabulary before the membership check
+    EVENT_TYPE_SYNONYMS = {
+        "td": "touchdown",
+        "score": "goal",
+        "pick": "interception",
+        "flag": "penalty",
+        "turnover": "fumble",
+    }
     
     # Strict JSON prompt - forces Gemini to output exactly what we need
     ANALYSIS_PROMPT = """\
@@ -73,10 +127,24 @@ Rules:
 - Output ONLY the JSON object, no other text
 """
 
+    # Tuned connection pool for the underlying httpx transports: segment
+    # analysis fans out up to 16 concurrent requests, so keep enough warm
+    # keepalive connections to serve a burst without new TLS handshakes.
+    _HTTP_LIMITS = {"max_keepalive_connections": 32, "max_connections": 64}
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize Gemini client."""
         self.api_key = api_key or self._get_api_key()
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                client_args={"limits": httpx.Limits(**self._HTTP_LIMITS)},
+                async_client_args={"limits": httpx.Limits(**self._HTTP_LIMITS)},
+            ),
+        )
+        # The prompt Part is identical for every segment — build (and
+        # pydantic-validate) it once instead of per call
+        self._prompt_part = types.Part(text=self.ANALYSIS_PROMPT)
     
     @staticmethod
     def _get_api_key() -> str:
@@ -100,15 +168,63 @@ Rules:
             Gemini file URI for use in analysis
         """
         uploaded = self.client.files.upload(file=video_path)
-        
-        # Wait for processing
-        while uploaded.state.name == "PROCESSING":
+        return self._wait_for_processing(uploaded)
+
+    def upload_video_stream(self, fileobj, mime_type: str = "video/mp4") -> str:
+        """
+        Upload a video to Gemini File API straight from a file object.
+
+        Avoids persisting the upload to local disk first — the SDK's
+        resumable upload reads chunks from the file object as it sends,
+        so local reads overlap with network sends.
+
+        Args:
+            fileobj: Binary file-like object positioned at the start
+            mime_type: Video MIME type (Gemini requires it for IO uploads)
+
+        Returns:
+            Gemini file URI for use in analysis
+        """
+        uploaded = self.client.files.upload(
+            file=fileobj,
+            config={"mime_type": mime_type},
+        )
+        return self._wait_for_processing(uploaded)
+
+    async def upload_video_stream_async(self, fileobj, mime_type: str = "video/mp4") -> str:
+        """
+        Async variant of upload_video_stream for route handlers.
+
+        Uploads via the SDK's async client and polls with exponential
+        backoff (100ms doubling to a 2s cap) instead of a fixed 2s
+        sleep, so fast uploads aren't stuck waiting out the interval —
+        and nothing blocks the event loop.
+        """
+        uploaded = await self.client.aio.files.upload(
+            file=fileobj,
+            config={"mime_type": mime_type},
+        )
+
+        delay = 0.1
+        while uploaded.state == types.FileState.PROCESSING:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 2.0)
+            uploaded = await self.client.aio.files.get(name=uploaded.name)
+
+        if uploaded.state != types.FileState.ACTIVE:
+            raise RuntimeError(f"Upload failed, state: {uploaded.state}")
+
+        return uploaded.uri
+
+    def _wait_for_processing(self, uploaded) -> str:
+        """Poll the File API until the upload is processed, return its URI."""
+        while uploaded.state == types.FileState.PROCESSING:
             time.sleep(2)
             uploaded = self.client.files.get(name=uploaded.name)
-        
-        if uploaded.state.name != "ACTIVE":
-            raise RuntimeError(f"Upload failed, state: {uploaded.state.name}")
-        
+
+        if uploaded.state != types.FileState.ACTIVE:
+            raise RuntimeError(f"Upload failed, state: {uploaded.state}")
+
         return uploaded.uri
     
     def analyze_segment(
@@ -131,66 +247,159 @@ Rules:
         Returns:
             GeminiAnalysisResult with validated data or error
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Build video clip content
-            video_metadata = types.VideoMetadata(
-                start_offset=f"{start_sec}s",
-                end_offset=f"{end_sec}s",
-            )
-            
-            content = types.Content(
-                parts=[
-                    types.Part(
-                        file_data=types.FileData(file_uri=video_uri),
-                        video_metadata=video_metadata,
-                    ),
-                    types.Part(text=self.ANALYSIS_PROMPT),
-                ]
-            )
-            
             # Make API call
             response = self.client.models.generate_content(
                 model=self.MODEL,
-                contents=content,
+                contents=self._build_segment_content(video_uri, start_sec, end_sec),
             )
             
-            latency_ms = int((time.time() - start_time) * 1000)
-            raw_text = (response.text or "").strip()
-            
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            raw_text = self._extract_text(response)
+
             # Parse and validate JSON
             return self._parse_response(raw_text, latency_ms)
             
         except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return GeminiAnalysisResult(
                 success=False,
                 error=str(e),
                 latency_ms=latency_ms,
             )
     
+    async def analyze_segment_async(
+        self,
+        video_uri: str,
+        start_sec: int,
+        end_sec: int,
+    ) -> GeminiAnalysisResult:
+        """
+        Async variant of analyze_segment.
+
+        Uses the SDK's native async client (client.aio) so the call
+        multiplexes on the event loop — no worker thread is tied up for
+        the multi-second round-trip.
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.MODEL,
+                contents=self._build_segment_content(video_uri, start_sec, end_sec),
+            )
+
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            raw_text = self._extract_text(response)
+
+            return self._parse_response(raw_text, latency_ms)
+
+        except Exception as e:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            return GeminiAnalysisResult(
+                success=False,
+                error=str(e),
+                latency_ms=latency_ms,
+            )
+
+    async def analyze_segments(
+        self,
+        video_uri: str,
+        ranges: "list[tuple[int, int]]",
+        concurrency: int = 16,
+    ) -> "list[GeminiAnalysisResult]":
+        """
+        Analyze many segments of one video concurrently.
+
+        Fires all requests on the event loop with a bounded semaphore so
+        N segments cost roughly one LLM round-trip of wall time instead
+        of N, without stampeding the API.
+
+        Args:
+            video_uri: Gemini file URI
+            ranges: (start_sec, end_sec) pairs
+            concurrency: Max in-flight requests
+
+        Returns:
+            Results in the same order as ranges
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(start_sec: int, end_sec: int) -> GeminiAnalysisResult:
+            async with sem:
+                return await self.analyze_segment_async(video_uri, start_sec, end_sec)
+
+        return list(await asyncio.gather(*(one(s, e) for s, e in ranges)))
+
+    def _build_segment_content(
+        self,
+        video_uri: str,
+        start_sec: int,
+        end_sec: int,
+    ) -> types.Content:
+        """Build the video-clip + prompt content for one segment."""
+        video_metadata = types.VideoMetadata(
+            start_offset=f"{start_sec}s",
+            end_offset=f"{end_sec}s",
+        )
+        return types.Content(
+            parts=[
+                types.Part(
+                    file_data=types.FileData(file_uri=video_uri),
+                    video_metadata=video_metadata,
+                ),
+                self._prompt_part,
+            ]
+        )
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        """
+        Pull the response text out of the first candidate's parts.
+
+        The strict-JSON prompt yields a single text part, so this is
+        usually one attribute read — no part-joining copy via
+        response.text and no strip() (the JSON decoder tolerates
+        surrounding whitespace). Falls back to response.text for
+        anything unusual.
+        """
+        try:
+            parts = response.candidates[0].content.parts
+        except (AttributeError, IndexError, TypeError):
+            return response.text or ""
+        if not parts:
+            return ""
+        if len(parts) == 1:
+            return parts[0].text or ""
+        return "".join(p.text or "" for p in parts)
+
     def _parse_response(self, raw_text: str, latency_ms: int) -> GeminiAnalysisResult:
         """
         Parse and validate Gemini response.
         
         If parsing fails or confidence is too low, returns failure.
         """
+        # Fast fail for empty (safety-filtered) responses — cheaper than
+        # raising through the decoder. Anything non-empty goes through
+        # the fence extractor: prose can legitimately precede the fence.
+        if not raw_text.lstrip():
+            return GeminiAnalysisResult(
+                success=False,
+                raw_response=raw_text,
+                latency_ms=latency_ms,
+                error="empty response",
+            )
+
         try:
-            # Try to extract JSON from response
-            # Sometimes Gemini wraps in markdown code blocks
-            json_text = raw_text
-            if "```json" in json_text:
-                json_text = json_text.split("```json")[1].split("```")[0]
-            elif "```" in json_text:
-                json_text = json_text.split("```")[1].split("```")[0]
-            
-            data = json.loads(json_text.strip())
-            
-            # Extract and normalize fields
-            event_type = self._normalize_event_type(data.get("event_type", "unknown"))
-            intensity = self._normalize_intensity(data.get("intensity", "low"))
-            confidence = self._clamp_confidence(data.get("confidence", 0.0))
+            # Sometimes Gemini wraps the JSON in a markdown code block
+            data = _GEMINI_DECODER.decode(_extract_fenced_json(raw_text))
+
+            # Normalize fields (decode already typed them)
+            event_type = self._normalize_event_type(data.event_type)
+            intensity = self._normalize_intensity(data.intensity)
+            confidence = self._clamp_confidence(data.confidence)
             
             # Check confidence threshold
             if confidence < self.CONFIDENCE_THRESHOLD:
@@ -198,8 +407,8 @@ Rules:
                     success=False,
                     event_type=event_type,
                     intensity=intensity,
-                    summary=data.get("summary", ""),
-                    crowd_reaction=data.get("crowd_reaction", ""),
+                    summary=data.summary,
+                    crowd_reaction=data.crowd_reaction,
                     confidence=confidence,
                     raw_response=raw_text,
                     latency_ms=latency_ms,
@@ -210,14 +419,14 @@ Rules:
                 success=True,
                 event_type=event_type,
                 intensity=intensity,
-                summary=data.get("summary", ""),
-                crowd_reaction=data.get("crowd_reaction", ""),
+                summary=data.summary,
+                crowd_reaction=data.crowd_reaction,
                 confidence=confidence,
                 raw_response=raw_text,
                 latency_ms=latency_ms,
             )
             
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except msgspec.DecodeError as e:
             return GeminiAnalysisResult(
                 success=False,
                 raw_response=raw_text,
@@ -225,22 +434,18 @@ Rules:
                 error=f"JSON parse error: {e}",
             )
     
-    @staticmethod
-    def _normalize_event_type(event_type: str) -> str:
+    @classmethod
+    def _normalize_event_type(cls, event_type: str) -> str:
         """Normalize event type to known enum value."""
-        known_types = {
-            "goal", "touchdown", "tackle", "interception", "fumble",
-            "penalty", "big_play", "injury", "halftime", "timeout",
-            "celebration", "unknown"
-        }
         normalized = event_type.lower().strip().replace(" ", "_")
-        return normalized if normalized in known_types else "unknown"
+        normalized = cls.EVENT_TYPE_SYNONYMS.get(normalized, normalized)
+        return normalized if normalized in cls.KNOWN_EVENT_TYPES else "unknown"
     
-    @staticmethod
-    def _normalize_intensity(intensity: str) -> str:
+    @classmethod
+    def _normalize_intensity(cls, intensity: str) -> str:
         """Normalize intensity to low/medium/high."""
         intensity_lower = intensity.lower().strip()
-        if intensity_lower in {"low", "medium", "high"}:
+        if intensity_lower in cls.VALID_INTENSITIES:
             return intensity_lower
         return "low"
     
@@ -252,3 +457,58 @@ Rules:
             return max(0.0, min(1.0, conf))
         except (ValueError, TypeError):
             return 0.0
+
+
+# ─────────────────────────────────────────────
+# Multi-process pipeline
+# ─────────────────────────────────────────────
+
+def _analyze_shard(
+    video_uri: str,
+    ranges: "list[tuple[int, int]]",
+) -> "list[GeminiAnalysisResult]":
+    """
+    Worker-process entry point: analyze one shard of segments.
+
+    Builds its own GeminiService (clients don't survive pickling) and
+    runs the shard on a fresh event loop.
+    """
+    service = GeminiService()
+    return asyncio.run(service.analyze_segments(video_uri, ranges))
+
+
+def run_pipeline(
+    video_uri: str,
+    ranges: "list[tuple[int, int]]",
+    max_workers: "Optional[int]" = None,
+) -> "list[GeminiAnalysisResult]":
+    """
+    Analyze segments across multiple worker processes, asyncio per worker.
+
+    The workload is I/O bound, so analyze_segments in one process covers
+    most sessions — reach for this only when per-result Python work (or
+    sheer segment count) saturates a single core. Only the video_uri
+    string crosses process boundaries, never file bytes.
+
+    Args:
+        video_uri: Gemini file URI
+        ranges: (start_sec, end_sec) pairs
+        max_workers: Worker processes; defaults to os.cpu_count()
+
+    Returns:
+        Results in the same order as ranges
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    n_workers = min(max_workers, len(ranges))
+    if n_workers <= 1:
+        return _analyze_shard(video_uri, ranges)
+
+    # Contiguous shards keep result order after concatenation
+    shard_size = -(-len(ranges) // n_workers)
+    shards = [ranges[i:i + shard_size] for i in range(0, len(ranges), shard_size)]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        shard_results = pool.map(_analyze_shard, repeat(video_uri), shards)
+
+    return [result for shard in shard_results for result in shard]
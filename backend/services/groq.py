@@ -7,33 +7,54 @@ It never makes decisions about whether to generate ads.
 Input: event_type, urgency, business_type, tone constraints
 Output: ad_copy, hashtags, promo suggestion
 """
-import json
+import hashlib
 import os
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 
+import httpx
+import msgspec
 from dotenv import load_dotenv
-from groq import Groq
+from groq import Groq, AsyncGroq
 
 # Load environment
 load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
 
 
-@dataclass
+class _AdJSON(msgspec.Struct):
+    """Typed shape of Groq's JSON-mode reply."""
+    ad_copy: str = ""
+    promo_suggestion: str = ""
+    social_hashtags: List[str] = []
+
+
+# Typed single-pass decode straight into the struct — no intermediate
+# dict and no per-field .get() calls in the parse path
+_AD_DECODER = msgspec.json.Decoder(_AdJSON)
+
+# One tuned connection pool per process, shared by every GroqService
+# instance: keepalive reuse skips the TCP+TLS handshake on each burst
+# of ad generations.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_http_client = httpx.Client(limits=_HTTP_LIMITS)
+_async_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+
+
+# slots drops the per-instance __dict__ (these are churned per ad call);
+# frozen makes results safely shareable, e.g. from caches
+@dataclass(slots=True, frozen=True)
 class AdGenerationResult:
     """Result from Groq ad generation."""
     success: bool
     ad_copy: str = ""
     promo_suggestion: str = ""
-    social_hashtags: List[str] = None
+    social_hashtags: List[str] = field(default_factory=list)
     latency_ms: int = 0
     error: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.social_hashtags is None:
-            self.social_hashtags = []
 
 
 class GroqService:
@@ -53,6 +74,7 @@ class GroqService:
     
     MODEL = "llama-3.3-70b-versatile"
     MAX_TOKENS = 200  # Keep it tight
+    AD_CACHE_MAX = 512  # In-process LRU entries for repeated prompts
     
     # System prompt: focused, constrained, no fluff
     SYSTEM_PROMPT = """\
@@ -72,12 +94,26 @@ Output ONLY valid JSON:
 }
 """
 
+    # User prompt skeleton — built once; _build_prompt only fills the slots
+    _PROMPT_TMPL = """\
+Event: {event}
+Description: {summary}
+Urgency: {urgency}
+Business: {biz}
+
+Generate an ad for this moment. JSON only."""
+
     def __init__(self, api_key: Optional[str] = None):
-        """Initialize Groq client."""
+        """Initialize sync and async Groq clients."""
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("Missing GROQ_API_KEY in environment")
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(api_key=self.api_key, http_client=_http_client)
+        self.async_client = AsyncGroq(api_key=self.api_key, http_client=_async_http_client)
+        # In-process LRU: a touchdown/aggressive/pizza tuple recurring
+        # during a game skips the ~500ms Groq round-trip entirely
+        self._ad_cache: "OrderedDict[tuple, AdGenerationResult]" = OrderedDict()
+        self._ad_cache_lock = threading.Lock()
     
     def generate_ad(
         self,
@@ -100,8 +136,15 @@ Output ONLY valid JSON:
         Returns:
             AdGenerationResult with ad copy and promo
         """
-        start_time = time.time()
-        
+        cache_key = self._ad_cache_key(
+            event_type, urgency, summary, business_name, business_type
+        )
+        cached = self._ad_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        start_ns = time.perf_counter_ns()
+
         try:
             # Build user prompt
             user_prompt = self._build_prompt(
@@ -120,20 +163,111 @@ Output ONLY valid JSON:
                 response_format={"type": "json_object"},
             )
             
-            latency_ms = int((time.time() - start_time) * 1000)
-            raw_text = response.choices[0].message.content.strip()
-            
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            # response_format=json_object guarantees JSON content and
+            # the decoder tolerates surrounding whitespace — no strip() copy
+            raw_text = response.choices[0].message.content
+
             # Parse response
-            return self._parse_response(raw_text, latency_ms)
+            result = self._parse_response(raw_text, latency_ms)
+            if result.success:
+                self._ad_cache_put(cache_key, result)
+            return result
             
         except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return AdGenerationResult(
                 success=False,
                 error=str(e),
                 latency_ms=latency_ms,
             )
     
+    async def generate_ad_async(
+        self,
+        event_type: str,
+        urgency: str,
+        summary: str = "",
+        business_name: str = "",
+        business_type: str = "",
+    ) -> AdGenerationResult:
+        """
+        Async variant of generate_ad.
+
+        Uses AsyncGroq so the round-trip multiplexes on the event loop
+        instead of tying up a worker thread.
+        """
+        cache_key = self._ad_cache_key(
+            event_type, urgency, summary, business_name, business_type
+        )
+        cached = self._ad_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        start_ns = time.perf_counter_ns()
+
+        try:
+            user_prompt = self._build_prompt(
+                event_type, urgency, summary, business_name, business_type
+            )
+
+            response = await self.async_client.chat.completions.create(
+                model=self.MODEL,
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.7,
+                max_tokens=self.MAX_TOKENS,
+                response_format={"type": "json_object"},
+            )
+
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            # response_format=json_object guarantees JSON content and
+            # the decoder tolerates surrounding whitespace — no strip() copy
+            raw_text = response.choices[0].message.content
+
+            result = self._parse_response(raw_text, latency_ms)
+            if result.success:
+                self._ad_cache_put(cache_key, result)
+            return result
+
+        except Exception as e:
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            return AdGenerationResult(
+                success=False,
+                error=str(e),
+                latency_ms=latency_ms,
+            )
+
+    @staticmethod
+    def _ad_cache_key(
+        event_type: str,
+        urgency: str,
+        summary: str,
+        business_name: str,
+        business_type: str,
+    ) -> tuple:
+        """Cache key for one prompt; the summary collapses to a short fingerprint."""
+        summary_fp = hashlib.blake2b(summary.encode(), digest_size=4).hexdigest()
+        return (event_type, urgency, summary_fp, business_name, business_type)
+
+    def _ad_cache_get(self, key: tuple) -> Optional[AdGenerationResult]:
+        """LRU lookup; hits report latency_ms=0 since no API call happened."""
+        with self._ad_cache_lock:
+            cached = self._ad_cache.get(key)
+            if cached is None:
+                return None
+            self._ad_cache.move_to_end(key)
+        return replace(cached, latency_ms=0)
+
+    def _ad_cache_put(self, key: tuple, result: AdGenerationResult) -> None:
+        """Store a successful generation, evicting the least recent entry."""
+        with self._ad_cache_lock:
+            self._ad_cache[key] = result
+            self._ad_cache.move_to_end(key)
+            if len(self._ad_cache) > self.AD_CACHE_MAX:
+                self._ad_cache.popitem(last=False)
+
     def _build_prompt(
         self,
         event_type: str,
@@ -143,30 +277,27 @@ Output ONLY valid JSON:
         business_type: str,
     ) -> str:
         """Build user prompt for Groq."""
-        biz = f"{business_name or 'Local Business'} ({business_type or 'general'})"
-        
-        return f"""\
-Event: {event_type.upper()}
-Description: {summary or 'Exciting game moment'}
-Urgency: {urgency}
-Business: {biz}
-
-Generate an ad for this moment. JSON only."""
+        return self._PROMPT_TMPL.format(
+            event=event_type.upper(),
+            summary=summary or "Exciting game moment",
+            urgency=urgency,
+            biz=f"{business_name or 'Local Business'} ({business_type or 'general'})",
+        )
     
     def _parse_response(self, raw_text: str, latency_ms: int) -> AdGenerationResult:
         """Parse and validate Groq response."""
         try:
-            data = json.loads(raw_text)
-            
+            data = _AD_DECODER.decode(raw_text)
+
             return AdGenerationResult(
                 success=True,
-                ad_copy=data.get("ad_copy", ""),
-                promo_suggestion=data.get("promo_suggestion", ""),
-                social_hashtags=data.get("social_hashtags", []),
+                ad_copy=data.ad_copy,
+                promo_suggestion=data.promo_suggestion,
+                social_hashtags=data.social_hashtags,
                 latency_ms=latency_ms,
             )
-            
-        except (json.JSONDecodeError, KeyError) as e:
+
+        except msgspec.DecodeError as e:
             return AdGenerationResult(
                 success=False,
                 error=f"JSON parse error: {e}",
@@ -0,0 +1,132 @@
+"""
+LLM Response Cache — EXACT-MATCH ONLY.
+
+LLM calls are the dominant latency and cost in the pipeline (seconds +
+tokens per call). Identical inputs produce cacheable outputs:
+
+- Gemini: keyed by (video_uri, start_sec, end_sec)
+- Groq: keyed by a BLAKE2 hash of the prompt inputs
+
+Entries expire after CACHE_TTL_SEC; expired rows are treated as misses
+and overwritten on the next store.
+"""
+import hashlib
+import json
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ..db.models import LLMCache, GroqCache, utcnow
+from .gemini import GeminiAnalysisResult
+from .groq import AdGenerationResult
+
+# How long cached LLM responses stay valid
+CACHE_TTL_SEC = 3600
+
+
+def _is_fresh(created_at: datetime) -> bool:
+    return created_at is not None and (
+        utcnow() - created_at < timedelta(seconds=CACHE_TTL_SEC)
+    )
+
+
+# ─────────────────────────────────────────────
+# Gemini Analysis Cache
+# ─────────────────────────────────────────────
+
+def get_cached_analysis(
+    db: Session,
+    video_uri: str,
+    start_sec: int,
+    end_sec: int,
+) -> GeminiAnalysisResult | None:
+    """Return a cached analysis for this exact segment, or None."""
+    entry = (
+        db.query(LLMCache)
+        .filter(
+            LLMCache.video_uri == video_uri,
+            LLMCache.start_sec == start_sec,
+            LLMCache.end_sec == end_sec,
+        )
+        .first()
+    )
+    if entry is None or not _is_fresh(entry.created_at):
+        return None
+    return GeminiAnalysisResult(**json.loads(entry.response_json))
+
+
+def store_analysis(
+    db: Session,
+    video_uri: str,
+    start_sec: int,
+    end_sec: int,
+    result: GeminiAnalysisResult,
+) -> None:
+    """
+    Cache a successful analysis, replacing any previous entry for this
+    segment. Commits as part of the caller's transaction.
+
+    SQLite upsert on the unique (video_uri, start_sec, end_sec) index:
+    one row per segment, race-free under concurrent writers.
+    """
+    now = utcnow()
+    payload = json.dumps(asdict(result))
+    db.execute(
+        sqlite_insert(LLMCache)
+        .values(
+            video_uri=video_uri,
+            start_sec=start_sec,
+            end_sec=end_sec,
+            response_json=payload,
+            created_at=now,
+        )
+        .on_conflict_do_update(
+            index_elements=["video_uri", "start_sec", "end_sec"],
+            set_={"response_json": payload, "created_at": now},
+        )
+    )
+
+
+# ─────────────────────────────────────────────
+# Groq Ad Cache
+# ─────────────────────────────────────────────
+
+def groq_cache_key(
+    event_type: str,
+    urgency: str,
+    summary: str,
+    business_name: str,
+    business_type: str,
+) -> str:
+    """BLAKE2 fingerprint of the Groq prompt inputs."""
+    payload = "\x1f".join((event_type, urgency, summary, business_name, business_type))
+    return hashlib.blake2b(payload.encode(), digest_size=32).hexdigest()
+
+
+def get_cached_ad(db: Session, cache_key: str) -> AdGenerationResult | None:
+    """Return a cached ad generation for this prompt fingerprint, or None."""
+    entry = db.query(GroqCache).filter(GroqCache.cache_key == cache_key).first()
+    if entry is None or not _is_fresh(entry.created_at):
+        return None
+    return AdGenerationResult(**json.loads(entry.response_json))
+
+
+def store_ad(db: Session, cache_key: str, result: AdGenerationResult) -> None:
+    """
+    Cache a successful ad generation, replacing any previous entry.
+
+    SQLite upsert on the unique cache_key — the old check-then-insert
+    raced under concurrent background tasks and leaked IntegrityError.
+    """
+    now = utcnow()
+    payload = json.dumps(asdict(result))
+    db.execute(
+        sqlite_insert(GroqCache)
+        .values(cache_key=cache_key, response_json=payload, created_at=now)
+        .on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={"response_json": payload, "created_at": now},
+        )
+    )
@@ -77,6 +77,31 @@ function App() {
         }
     }
 
+    // Ad generation runs server-side in the background after the
+    // analyze-segment response, so poll /ads?event_id= until the row
+    // lands, then append it to the feed
+    const fetchPendingAd = async (event, decisionReason) => {
+        for (let attempt = 0; attempt < 10; attempt++) {
+            await new Promise(r => setTimeout(r, 1000))
+            try {
+                const res = await fetch(`${API_BASE}/api/ads?event_id=${event.id}`)
+                if (!res.ok) continue
+                const rows = await res.json()
+                if (rows.length > 0) {
+                    setAds(prev => [...prev, {
+                        ...rows[0],
+                        source_event: event,
+                        decision_reason: decisionReason,
+                    }])
+                    fetchMetrics()
+                    return
+                }
+            } catch (err) {
+                console.error(`Ad fetch for event ${event.id} failed:`, err)
+            }
+        }
+    }
+
     // Upload video
     const handleFileChange = async (e) => {
         const file = e.target.files?.[0]
@@ -170,7 +195,8 @@ function App() {
                             setEvents(prev => [...prev, newEvent])
                         }
 
-                        // Add ad if generated
+                        // Add ad if returned inline; otherwise it's being
+                        // generated in the background — poll for it
                         if (data.ad) {
                             const newAd = {
                                 ...data.ad,
@@ -178,6 +204,8 @@ function App() {
                                 decision_reason: data.decision_reason,
                             }
                             setAds(prev => [...prev, newAd])
+                        } else if (data.event?.generate_ad) {
+                            fetchPendingAd(data.event, data.decision_reason)
                         }
 
                         // Refresh metrics